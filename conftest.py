@@ -0,0 +1,5 @@
+import os
+
+# bcrypt's work factor is irrelevant to the tests; use the minimum cost.
+# Set before any test module imports crm_10_implementation.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
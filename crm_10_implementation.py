@@ -17,6 +17,7 @@ app = FastAPI()
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
 
 # Pydantic model for login request
 class LoginRequest(BaseModel):
@@ -32,11 +33,11 @@ class TokenResponse(BaseModel):
 users_db: Dict[str, Dict[str, Any]] = {
     "user1": {
         "username": "user1",
-        "hashed_password": bcrypt.hashpw("password1".encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        "hashed_password": bcrypt.hashpw("password1".encode("utf-8"), bcrypt.gensalt(BCRYPT_ROUNDS)).decode("utf-8")
     },
     "user2": {
         "username": "user2",
-        "hashed_password": bcrypt.hashpw("password2".encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        "hashed_password": bcrypt.hashpw("password2".encode("utf-8"), bcrypt.gensalt(BCRYPT_ROUNDS)).decode("utf-8")
     }
 }
 
@@ -30,6 +30,28 @@ class GameStatus(Enum):
     WIN_X = "win_x"
     WIN_O = "win_o"
 
+# Winning lines as flat cell indices (row * 3 + col).
+WIN_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+
+# Immutable template for a fresh board; copy the rows before mutating.
+EMPTY_BOARD = ((Player.EMPTY,) * 3,) * 3
+
+def _compile_winner_check() -> Callable[[List[List[Player]]], Optional[Player]]:
+    """Generate a winner check with one straight-line test per WIN_LINES entry."""
+    src = ["def check_winner(board):", "    f = board[0] + board[1] + board[2]"]
+    for a, b, c in WIN_LINES:
+        src.append(f"    if f[{a}] is not EMPTY and f[{a}] == f[{b}] == f[{c}]: return f[{a}]")
+    src.append("    return None")
+    namespace = {"EMPTY": Player.EMPTY}
+    exec(compile("\n".join(src), "<check_winner>", "exec"), namespace)
+    return namespace["check_winner"]
+
+_unrolled_check_winner = _compile_winner_check()
+
 # --- Strategy Pattern for AI ---
 
 class AIStrategy(ABC):
@@ -94,13 +116,7 @@ class MinimaxAI(AIStrategy):
             return best_score
 
     def _check_winner(self, board: List[List[Player]]) -> Optional[Player]:
-        # Rows, Cols, Diagonals
-        for i in range(3):
-            if board[i][0] == board[i][1] == board[i][2] != Player.EMPTY: return board[i][0]
-            if board[0][i] == board[1][i] == board[2][i] != Player.EMPTY: return board[0][i]
-        if board[0][0] == board[1][1] == board[2][2] != Player.EMPTY: return board[0][0]
-        if board[0][2] == board[1][1] == board[2][0] != Player.EMPTY: return board[0][2]
-        return None
+        return _unrolled_check_winner(board)
 
     def _is_board_full(self, board: List[List[Player]]) -> bool:
         return all(cell != Player.EMPTY for row in board for cell in row)
@@ -110,7 +126,7 @@ class MinimaxAI(AIStrategy):
 class GameEngine:
     """Core logic and state management for Tic Tac Toe."""
     def __init__(self):
-        self.board: List[List[Player]] = [[Player.EMPTY for _ in range(3)] for _ in range(3)]
+        self.board: List[List[Player]] = [list(row) for row in EMPTY_BOARD]
         self.current_turn: Player = Player.X
         self.status: GameStatus = GameStatus.PLAYING
         self.observers: List[Callable] = []
@@ -129,7 +145,7 @@ class GameEngine:
             return False
 
         self.board[row][col] = self.current_turn
-        self._update_status()
+        self._update_status(row, col)
         
         if self.status == GameStatus.PLAYING:
             self.current_turn = Player.O if self.current_turn == Player.X else Player.X
@@ -137,8 +153,8 @@ class GameEngine:
         self._notify()
         return True
 
-    def _update_status(self):
-        winner = self._get_winner()
+    def _update_status(self, row: int, col: int):
+        winner = self._get_winner(row, col)
         if winner == Player.X:
             self.status = GameStatus.WIN_X
         elif winner == Player.O:
@@ -148,17 +164,23 @@ class GameEngine:
         else:
             self.status = GameStatus.PLAYING
 
-    def _get_winner(self) -> Optional[Player]:
-        for i in range(3):
-            if self.board[i][0] == self.board[i][1] == self.board[i][2] != Player.EMPTY: return self.board[i][0]
-            if self.board[0][i] == board[1][i] == board[2][i] != Player.EMPTY: return self.board[0][i]
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] != Player.EMPTY: return self.board[0][0]
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] != Player.EMPTY: return self.board[0][2]
+    def _get_winner(self, row: int, col: int) -> Optional[Player]:
+        """Check only the lines through the last move; a win must include it."""
+        board = self.board
+        player = board[row][col]
+        if board[row][0] == board[row][1] == board[row][2] == player:
+            return player
+        if board[0][col] == board[1][col] == board[2][col] == player:
+            return player
+        if row == col and board[0][0] == board[1][1] == board[2][2] == player:
+            return player
+        if row + col == 2 and board[0][2] == board[1][1] == board[2][0] == player:
+            return player
         return None
 
     def reset(self):
         """Reset the game state."""
-        self.board = [[Player.EMPTY for _ in range(3)] for _ in range(3)]
+        self.board = [list(row) for row in EMPTY_BOARD]
         self.current_turn = Player.X
         self.status = GameStatus.PLAYING
         self._notify()
@@ -252,6 +274,8 @@ class TicTacToeUI(tk.Tk):
 
     def _handle_click(self, r: int, c: int):
         """User interaction handler."""
+        if self.engine.status != GameStatus.PLAYING:
+            return
         if self.engine.current_turn == Player.X or self.ai is None:
             if self.engine.make_move(r, c):
                 if self.ai and self.engine.status == GameStatus.PLAYING:
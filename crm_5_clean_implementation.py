@@ -0,0 +1,262 @@
+"""
+Tic Tac Toe Game Implementation (Clean Version)
+
+Python backend game engine with optional HTML/CSS/JS generation.
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, FrozenSet, Iterable, Tuple
+import json
+
+SYMBOLS: FrozenSet[str] = frozenset({"X", "O"})
+
+
+# -----------------------------
+# Player
+# -----------------------------
+class Player:
+    """Represents a Tic Tac Toe player."""
+
+    def __init__(self, symbol: str, name: str):
+        if symbol not in SYMBOLS:
+            raise ValueError("Symbol must be 'X' or 'O'")
+        self.symbol = symbol
+        self.name = name
+
+
+# -----------------------------
+# Bitboard Layout
+# -----------------------------
+# Cell (row, col) is bit row * 3 + col of a 9-bit mask.
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # columns
+    0b100010001, 0b001010100,               # diagonals
+)
+FULL_MASK = 0b111111111
+
+
+@lru_cache(maxsize=4096)
+def _winner_of(x: int, o: int) -> Optional[str]:
+    """Winner for a pair of bitboards; pure, so results are shared by all games."""
+    for mask in WIN_MASKS:
+        if (x & mask) == mask:
+            return "X"
+        if (o & mask) == mask:
+            return "O"
+    return None
+
+
+# -----------------------------
+# Game Board
+# -----------------------------
+class GameBoard:
+    """3x3 Tic Tac Toe board stored as one bitboard per symbol."""
+
+    def __init__(self):
+        self.size = 3
+        self._x = 0
+        self._o = 0
+
+    @property
+    def board(self) -> List[List[str]]:
+        """Nested-list view of the board, built on each read."""
+        x, o = self._x, self._o
+        return [
+            ["X" if x >> i & 1 else "O" if o >> i & 1 else "" for i in range(r, r + 3)]
+            for r in (0, 3, 6)
+        ]
+
+    @property
+    def bitboards(self) -> Tuple[int, int]:
+        """The (X, O) bitboards; cell (row, col) is bit row * 3 + col."""
+        return self._x, self._o
+
+    @bitboards.setter
+    def bitboards(self, masks: Tuple[int, int]) -> None:
+        x, o = masks
+        if (x | o) & ~FULL_MASK or x & o:
+            raise ValueError("Invalid bitboards")
+        self._x, self._o = x, o
+
+    def winner(self) -> Optional[str]:
+        return _winner_of(self._x, self._o)
+
+    def get_cell(self, row: int, col: int) -> str:
+        self._validate_position(row, col)
+        bit = 1 << (row * 3 + col)
+        return "X" if self._x & bit else "O" if self._o & bit else ""
+
+    def set_cell(self, row: int, col: int, symbol: str) -> None:
+        self._validate_position(row, col)
+
+        if symbol not in SYMBOLS:
+            raise ValueError("Invalid symbol")
+
+        bit = 1 << (row * 3 + col)
+        if (self._x | self._o) & bit:
+            raise ValueError("Cell already occupied")
+
+        if symbol == "X":
+            self._x |= bit
+        else:
+            self._o |= bit
+
+    def clear_cell(self, row: int, col: int) -> None:
+        self._validate_position(row, col)
+        keep = ~(1 << (row * 3 + col))
+        self._x &= keep
+        self._o &= keep
+
+    def is_full(self) -> bool:
+        return (self._x | self._o) == FULL_MASK
+
+    def reset(self) -> None:
+        self._x = 0
+        self._o = 0
+
+    def to_dict(self) -> List[List[str]]:
+        return self.board
+
+    def _validate_position(self, row: int, col: int) -> None:
+        if not (0 <= row < 3 and 0 <= col < 3):
+            raise IndexError("Row and column must be between 0 and 2")
+
+
+# -----------------------------
+# Win Checker
+# -----------------------------
+class WinChecker:
+    """Utility class for win checking."""
+
+    @staticmethod
+    def check_winner(board: GameBoard) -> Optional[str]:
+        return board.winner()
+
+
+# -----------------------------
+# Game Engine
+# -----------------------------
+class GameEngine:
+    """Main Tic Tac Toe game engine."""
+
+    def __init__(self):
+        self.players = (
+            Player("X", "Player X"),
+            Player("O", "Player O"),
+        )
+        self.current_player_index = 0
+        self.board = GameBoard()
+        self.winner: Optional[str] = None
+        self.game_over = False
+        self.move_history: List[Dict[str, Any]] = []
+
+    def current_player(self) -> Player:
+        return self.players[self.current_player_index]
+
+    def make_move(self, row: int, col: int) -> Dict[str, Any]:
+        return self.make_moves(((row, col),))
+
+    def make_moves(self, moves: Iterable[Tuple[int, int]]) -> Dict[str, Any]:
+        """Play (row, col) moves in order; the state is built once, after the last one.
+
+        Stops at the first rejected move and returns its error; the moves
+        before it stay on the board.
+        """
+        message = "Move successful"
+        for row, col in moves:
+            if self.game_over:
+                return {"success": False, "error": "Game is already over"}
+
+            try:
+                symbol = self.current_player().symbol
+                self.board.set_cell(row, col, symbol)
+
+                self.move_history.append(
+                    {"row": row, "col": col, "symbol": symbol}
+                )
+
+                winner = WinChecker.check_winner(self.board)
+                if winner:
+                    self.winner = winner
+                    self.game_over = True
+                    message = f"{winner} wins!"
+                elif self.board.is_full():
+                    self.game_over = True
+                    message = "Game ended in a draw"
+                else:
+                    self._switch_player()
+                    message = "Move successful"
+
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+
+        return self._response(message)
+
+    def undo_move(self) -> bool:
+        if not self.move_history or self.game_over:
+            return False
+
+        last = self.move_history.pop()
+        self.board.clear_cell(last["row"], last["col"])
+        self._switch_player()
+        return True
+
+    def reset_game(self) -> None:
+        self.board.reset()
+        self.current_player_index = 0
+        self.winner = None
+        self.game_over = False
+        self.move_history.clear()
+
+    def get_game_state(self) -> Dict[str, Any]:
+        return {
+            "board": self.board.to_dict(),
+            "current_player": self.current_player().name,
+            "winner": self.winner,
+            "game_over": self.game_over,
+            "moves": self.move_history,
+        }
+
+    def serialize_state(self) -> str:
+        """Pack X bits, O bits and the turn into eight hex digits."""
+        x, o = self.board.bitboards
+        packed = (x << 10) | (o << 1) | self.current_player_index
+        return f"{packed:08x}"
+
+    def deserialize_state(self, state: str) -> None:
+        """Restore a position from serialize_state(); move history is not kept."""
+        packed = int(state, 16)
+        self.board.bitboards = ((packed >> 10) & FULL_MASK, (packed >> 1) & FULL_MASK)
+        self.current_player_index = packed & 1
+        self.winner = WinChecker.check_winner(self.board)
+        self.game_over = self.winner is not None or self.board.is_full()
+        self.move_history.clear()
+
+    def _switch_player(self) -> None:
+        self.current_player_index = (self.current_player_index + 1) % 2
+
+    def _response(self, message: str) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "message": message,
+            "state": self.get_game_state(),
+        }
+
+
+# -----------------------------
+# Demo
+# -----------------------------
+def main() -> None:
+    game = GameEngine()
+    print("Tic Tac Toe started\n")
+
+    print(json.dumps(game.make_move(0, 0), indent=2))
+    print(json.dumps(game.make_move(1, 1), indent=2))
+    print(json.dumps(game.make_move(0, 1), indent=2))
+    print(json.dumps(game.make_move(2, 2), indent=2))
+    print(json.dumps(game.make_move(0, 2), indent=2))  # X wins
+
+
+if __name__ == "__main__":
+    main()
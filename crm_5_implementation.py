@@ -16,10 +16,16 @@ Functions:
 
 import json
 import os
-from typing import List, Optional, Tuple, Dict, Any
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Dict, Any
 from enum import Enum
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 class PlayerSymbol(Enum):
     """Enumeration for player symbols."""
@@ -40,6 +46,22 @@ class Player:
     """Represents a player in the Tic Tac Toe game."""
     symbol: PlayerSymbol
     name: str
+    
+    def __post_init__(self) -> None:
+        """
+        Validate the player's symbol.
+        
+        Raises:
+            TypeError: If symbol is not a PlayerSymbol
+        """
+        if not isinstance(self.symbol, PlayerSymbol):
+            raise TypeError("Player symbol must be a PlayerSymbol")
+
+
+# Cell encoding for GameBoard's flat storage: 0 = empty, 1 = X, 2 = O
+_SYMBOL_CODES: Dict[PlayerSymbol, int] = {PlayerSymbol.X: 1, PlayerSymbol.O: 2}
+_CODE_SYMBOLS: Tuple[Optional[PlayerSymbol], ...] = (None, PlayerSymbol.X, PlayerSymbol.O)
+_CODE_VALUES: Tuple[Optional[str], ...] = (None, PlayerSymbol.X.value, PlayerSymbol.O.value)
 
 
 class GameBoard:
@@ -49,13 +71,42 @@ class GameBoard:
         """
         Initialize the game board.
         
+        Cells are stored row-major in a flat bytearray, one byte per cell.
+        
         Args:
             size: The size of the board (default 3 for 3x3)
+            
+        Raises:
+            ValueError: If size is not positive
         """
+        if size <= 0:
+            raise ValueError("Board size must be positive")
+            
         self.size = size
-        self.board: List[List[Optional[PlayerSymbol]]] = [
-            [None for _ in range(size)] for _ in range(size)
-        ]
+        self._cells = bytearray(size * size)
+        
+    @property
+    def board(self) -> List[List[Optional[PlayerSymbol]]]:
+        """
+        Get the board as a grid of symbols.
+        
+        Returns:
+            A freshly built list of rows, with None for empty cells
+        """
+        size = self.size
+        cells = [_CODE_SYMBOLS[code] for code in self._cells]
+        return [cells[r * size:(r + 1) * size] for r in range(size)]
+        
+    def to_values(self) -> List[List[Optional[str]]]:
+        """
+        Get the board as a grid of symbol values.
+        
+        Returns:
+            A freshly built list of rows holding "X", "O" or None
+        """
+        size = self.size
+        values = [_CODE_VALUES[code] for code in self._cells]
+        return [values[r * size:(r + 1) * size] for r in range(size)]
         
     def make_move(self, row: int, col: int, symbol: PlayerSymbol) -> bool:
         """
@@ -75,10 +126,11 @@ class GameBoard:
         if not (0 <= row < self.size and 0 <= col < self.size):
             raise IndexError("Move coordinates are out of bounds")
             
-        if self.board[row][col] is not None:
+        index = row * self.size + col
+        if self._cells[index]:
             return False
             
-        self.board[row][col] = symbol
+        self._cells[index] = _SYMBOL_CODES[symbol]
         return True
         
     def get_cell(self, row: int, col: int) -> Optional[PlayerSymbol]:
@@ -92,7 +144,7 @@ class GameBoard:
         Returns:
             The symbol at the cell or None if empty
         """
-        return self.board[row][col]
+        return _CODE_SYMBOLS[self._cells[row * self.size + col]]
         
     def is_full(self) -> bool:
         """
@@ -101,11 +153,7 @@ class GameBoard:
         Returns:
             True if board is full, False otherwise
         """
-        for row in self.board:
-            for cell in row:
-                if cell is None:
-                    return False
-        return True
+        return 0 not in self._cells
         
     def get_empty_cells(self) -> List[Tuple[int, int]]:
         """
@@ -114,18 +162,53 @@ class GameBoard:
         Returns:
             List of tuples containing (row, col) of empty cells
         """
+        size = self.size
+        cells = self._cells
         empty_cells = []
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.board[row][col] is None:
-                    empty_cells.append((row, col))
+        # bytearray.find scans for the next empty byte in C (memchr)
+        index = cells.find(0)
+        while index != -1:
+            empty_cells.append(divmod(index, size))
+            index = cells.find(0, index + 1)
         return empty_cells
         
+    def completes_line(self, row: int, col: int) -> bool:
+        """
+        Check if the symbol at a cell fills a line through that cell.
+        
+        Args:
+            row: Row index (0-based)
+            col: Column index (0-based)
+            
+        Returns:
+            True if a row, column or diagonal through the cell holds only
+            that cell's symbol, False otherwise (always False for an empty cell)
+        """
+        size = self.size
+        cells = self._cells
+        index = row * size + col
+        if not cells[index]:
+            return False
+        # Each line is a strided slice of the flat cells; a full line is a
+        # slice holding only the cell's code
+        line = cells[index:index + 1] * size
+        
+        # Check row and column
+        if cells[row * size:(row + 1) * size] == line or cells[col::size] == line:
+            return True
+            
+        # Check diagonals
+        if row == col and cells[::size + 1] == line:
+            return True
+            
+        if row + col == size - 1 and cells[size - 1:size * size - 1:size - 1] == line:
+            return True
+                
+        return False
+        
     def reset(self) -> None:
         """Reset the board to initial state."""
-        self.board = [
-            [None for _ in range(self.size)] for _ in range(self.size)
-        ]
+        self._cells[:] = bytes(len(self._cells))
 
 
 class TicTacToe:
@@ -183,6 +266,25 @@ class TicTacToe:
             
         return success
         
+    def apply_moves(self, moves: Iterable[Tuple[int, int]]) -> bool:
+        """
+        Play a sequence of moves for alternating players.
+        
+        Args:
+            moves: (row, col) pairs in play order
+            
+        Returns:
+            True if every move was made, False at the first rejected move
+            
+        Raises:
+            ValueError: If the game ends before the sequence is exhausted
+        """
+        make_move = self.make_move
+        for row, col in moves:
+            if not make_move(row, col):
+                return False
+        return True
+        
     def _check_win(self, row: int, col: int) -> bool:
         """
         Check if the last move resulted in a win.
@@ -194,28 +296,7 @@ class TicTacToe:
         Returns:
             True if the move resulted in a win, False otherwise
         """
-        symbol = self.board.get_cell(row, col)
-        
-        # Check row
-        if all(self.board.get_cell(row, c) == symbol for c in range(self.board.size)):
-            return True
-            
-        # Check column
-        if all(self.board.get_cell(r, col) == symbol for r in range(self.board.size)):
-            return True
-            
-        # Check diagonals
-        if row == col:
-            # Main diagonal
-            if all(self.board.get_cell(i, i) == symbol for i in range(self.board.size)):
-                return True
-                
-        if row + col == self.board.size - 1:
-            # Anti-diagonal
-            if all(self.board.get_cell(i, self.board.size - 1 - i) == symbol for i in range(self.board.size)):
-                return True
-                
-        return False
+        return self.board.completes_line(row, col)
         
     def get_game_state(self) -> Dict[str, Any]:
         """
@@ -227,10 +308,7 @@ class TicTacToe:
         return {
             "status": self.status.value,
             "current_player_symbol": self.current_player.symbol.value,
-            "board": [
-                [cell.value if cell else None for cell in row]
-                for row in self.board.board
-            ],
+            "board": self.board.to_values(),
             "winner": self.winner.symbol.value if self.winner else None,
             "move_history": self.move_history
         }
@@ -271,19 +349,9 @@ class TicTacToe:
         return self.board
 
 
-def create_html_template(game_state: Dict[str, Any], game_id: str) -> str:
-    """
-    Create an HTML template for the Tic Tac Toe game.
-    
-    Args:
-        game_state: Current game state dictionary
-        game_id: Unique identifier for the game instance
-        
-    Returns:
-        HTML string representing the game interface
-    """
-    # Create basic HTML structure with embedded CSS and JavaScript
-    html_content = f"""
+# Page skeleton for create_html_template; braces meant for CSS/JS are doubled
+# for str.format_map.
+_HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -397,12 +465,9 @@ def create_html_template(game_state: Dict[str, Any], game_id: str) -> str:
 <body>
     <div class="game-container">
         <h1>Tic Tac Toe</h1>
-        <div id="status" class="status">Current Player: {game_state['current_player_symbol']}</div>
+        <div id="status" class="status">Current Player: {current_player}</div>
         <div id="board" class="board">
-            {"".join([
-                f'<div class="cell" onclick="makeMove({r}, {c})" data-row="{r}" data-col="{c}"></div>'
-                for r in range(3) for c in range(3)
-            ])}
+            {cells}
         </div>
         <div class="controls">
             <button onclick="resetGame()">Reset Game</button>
@@ -411,7 +476,7 @@ def create_html_template(game_state: Dict[str, Any], game_id: str) -> str:
     </div>
 
     <script>
-        const gameState = {json.dumps(game_state)};
+        const gameState = {state_json};
         const gameID = "{game_id}";
         
         function updateBoard() {{
@@ -425,7 +490,7 @@ def create_html_template(game_state: Dict[str, Any], game_id: str) -> str:
                 
                 if (symbol) {{
                     cell.textContent = symbol;
-                    cell.className = `cell ${symbol.toLowerCase()}`;
+                    cell.className = `cell ${{symbol.toLowerCase()}}`;
                 }} else {{
                     cell.textContent = '';
                     cell.className = 'cell';
@@ -458,7 +523,7 @@ def create_html_template(game_state: Dict[str, Any], game_id: str) -> str:
         
         function makeMove(row, col) {{
             // In a real implementation, this would send the move to the backend
-            console.log(`Move made: Row ${row}, Col ${col}`);
+            console.log(`Move made: Row ${{row}}, Col ${{col}}`);
         }}
         
         function resetGame() {{
@@ -479,8 +544,65 @@ def create_html_template(game_state: Dict[str, Any], game_id: str) -> str:
 </body>
 </html>
 """
+
+_BOARD_CELLS_HTML = "".join(
+    f'<div class="cell" onclick="makeMove({r}, {c})" data-row="{r}" data-col="{c}"></div>'
+    for r in range(3) for c in range(3)
+)
+
+
+@lru_cache(maxsize=128)
+def _render_html(current_player: str, state_json: str, game_id: str) -> str:
+    """
+    Fill the page skeleton, memoized on everything the page embeds.
     
-    return html_content
+    Args:
+        current_player: Symbol shown in the status line
+        state_json: Serialized game state embedded in the page script
+        game_id: Unique identifier for the game instance
+        
+    Returns:
+        HTML string representing the game interface
+    """
+    return _HTML_TEMPLATE.format_map({
+        "current_player": current_player,
+        "cells": _BOARD_CELLS_HTML,
+        "state_json": state_json,
+        "game_id": game_id,
+    })
+
+
+def create_html_template(game_state: Dict[str, Any], game_id: str) -> str:
+    """
+    Create an HTML template for the Tic Tac Toe game.
+    
+    Args:
+        game_state: Current game state dictionary
+        game_id: Unique identifier for the game instance
+        
+    Returns:
+        HTML string representing the game interface
+    """
+    state_json = json.dumps(game_state, default=_enum_value)
+    return _render_html(game_state['current_player_symbol'], state_json, game_id)
+
+
+def _enum_value(obj: Any) -> Any:
+    """
+    Serialize enum members by value, matching orjson's native enum support.
+    
+    Args:
+        obj: Object the stdlib JSON encoder could not serialize
+        
+    Returns:
+        The enum member's value
+        
+    Raises:
+        TypeError: If obj is not an enum member
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def save_game_state(game: TicTacToe, file_path: str) -> None:
@@ -497,8 +619,12 @@ def save_game_state(game: TicTacToe, file_path: str) -> None:
         # Ensure directory exists
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        with open(file_path, 'w') as f:
-            json.dump(game_state, f, indent=2)
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(game_state, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(game_state, f, indent=2, default=_enum_value)
             
     except Exception as e:
         raise IOError(f"Failed to save game state: {str(e)}")
@@ -519,6 +645,9 @@ def load_game_state(file_path: str) -> Dict[str, Any]:
         json.JSONDecodeError: If the file is not valid JSON
     """
     try:
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
         with open(file_path, 'r') as f:
             return json.load(f)
     except FileNotFoundError:
@@ -539,7 +668,7 @@ def main() -> None:
     # Display initial state
     print("Initial Game State:")
     state = game.get_game_state()
-    print(json.dumps(state, indent=2))
+    print(json.dumps(state, indent=2, default=_enum_value))
     
     # Example moves
     try:
@@ -551,7 +680,7 @@ def main() -> None:
         
         print("\nAfter example moves:")
         state = game.get_game_state()
-        print(json.dumps(state, indent=2))
+        print(json.dumps(state, indent=2, default=_enum_value))
         
         # Save the game state
         save_game_state(game, "games/tic_tac_toe_game.json")
@@ -561,199 +690,5 @@ def main() -> None:
         print(f"Error during game execution: {e}")
 
 
-if __name__ == "__main__":
-    main()
-Tic Tac Toe Game Implementation (Clean Version)
-
-Python backend game engine with optional HTML/CSS/JS generation.
-"""
-
-from typing import List, Optional, Dict, Any
-import json
-
-
-# -----------------------------
-# Player
-# -----------------------------
-class Player:
-    """Represents a Tic Tac Toe player."""
-
-    def __init__(self, symbol: str, name: str):
-        if symbol not in ("X", "O"):
-            raise ValueError("Symbol must be 'X' or 'O'")
-        self.symbol = symbol
-        self.name = name
-
-
-# -----------------------------
-# Game Board
-# -----------------------------
-class GameBoard:
-    """3x3 Tic Tac Toe board."""
-
-    def __init__(self):
-        self.size = 3
-        self.board = [["" for _ in range(3)] for _ in range(3)]
-
-    def get_cell(self, row: int, col: int) -> str:
-        self._validate_position(row, col)
-        return self.board[row][col]
-
-    def set_cell(self, row: int, col: int, symbol: str) -> None:
-        self._validate_position(row, col)
-
-        if symbol not in ("X", "O"):
-            raise ValueError("Invalid symbol")
-
-        if self.board[row][col] != "":
-            raise ValueError("Cell already occupied")
-
-        self.board[row][col] = symbol
-
-    def clear_cell(self, row: int, col: int) -> None:
-        self._validate_position(row, col)
-        self.board[row][col] = ""
-
-    def is_full(self) -> bool:
-        return all(cell != "" for row in self.board for cell in row)
-
-    def reset(self) -> None:
-        self.board = [["" for _ in range(3)] for _ in range(3)]
-
-    def to_dict(self) -> List[List[str]]:
-        return [row[:] for row in self.board]
-
-    def _validate_position(self, row: int, col: int) -> None:
-        if not (0 <= row < 3 and 0 <= col < 3):
-            raise IndexError("Row and column must be between 0 and 2")
-
-
-# -----------------------------
-# Win Checker
-# -----------------------------
-class WinChecker:
-    """Utility class for win checking."""
-
-    @staticmethod
-    def check_winner(board: GameBoard) -> Optional[str]:
-        b = board.board
-
-        lines = (
-            # rows
-            b[0], b[1], b[2],
-            # columns
-            [b[0][0], b[1][0], b[2][0]],
-            [b[0][1], b[1][1], b[2][1]],
-            [b[0][2], b[1][2], b[2][2]],
-            # diagonals
-            [b[0][0], b[1][1], b[2][2]],
-            [b[0][2], b[1][1], b[2][0]],
-        )
-
-        for line in lines:
-            if line[0] and line.count(line[0]) == 3:
-                return line[0]
-
-        return None
-
-
-# -----------------------------
-# Game Engine
-# -----------------------------
-class GameEngine:
-    """Main Tic Tac Toe game engine."""
-
-    def __init__(self):
-        self.players = [
-            Player("X", "Player X"),
-            Player("O", "Player O"),
-        ]
-        self.current_player_index = 0
-        self.board = GameBoard()
-        self.winner: Optional[str] = None
-        self.game_over = False
-        self.move_history: List[Dict[str, Any]] = []
-
-    def current_player(self) -> Player:
-        return self.players[self.current_player_index]
-
-    def make_move(self, row: int, col: int) -> Dict[str, Any]:
-        if self.game_over:
-            return {"success": False, "error": "Game is already over"}
-
-        try:
-            symbol = self.current_player().symbol
-            self.board.set_cell(row, col, symbol)
-
-            self.move_history.append(
-                {"row": row, "col": col, "symbol": symbol}
-            )
-
-            winner = WinChecker.check_winner(self.board)
-            if winner:
-                self.winner = winner
-                self.game_over = True
-                return self._response(f"{winner} wins!")
-
-            if self.board.is_full():
-                self.game_over = True
-                return self._response("Game ended in a draw")
-
-            self._switch_player()
-            return self._response("Move successful")
-
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-
-    def undo_move(self) -> bool:
-        if not self.move_history or self.game_over:
-            return False
-
-        last = self.move_history.pop()
-        self.board.clear_cell(last["row"], last["col"])
-        self._switch_player()
-        return True
-
-    def reset_game(self) -> None:
-        self.board.reset()
-        self.current_player_index = 0
-        self.winner = None
-        self.game_over = False
-        self.move_history.clear()
-
-    def get_game_state(self) -> Dict[str, Any]:
-        return {
-            "board": self.board.to_dict(),
-            "current_player": self.current_player().name,
-            "winner": self.winner,
-            "game_over": self.game_over,
-            "moves": self.move_history,
-        }
-
-    def _switch_player(self) -> None:
-        self.current_player_index = (self.current_player_index + 1) % 2
-
-    def _response(self, message: str) -> Dict[str, Any]:
-        return {
-            "success": True,
-            "message": message,
-            "state": self.get_game_state(),
-        }
-
-
-# -----------------------------
-# Demo
-# -----------------------------
-def main() -> None:
-    game = GameEngine()
-    print("Tic Tac Toe started\n")
-
-    print(json.dumps(game.make_move(0, 0), indent=2))
-    print(json.dumps(game.make_move(1, 1), indent=2))
-    print(json.dumps(game.make_move(0, 1), indent=2))
-    print(json.dumps(game.make_move(2, 2), indent=2))
-    print(json.dumps(game.make_move(0, 2), indent=2))  # X wins
-
-
 if __name__ == "__main__":
     main()
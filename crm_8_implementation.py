@@ -1,6 +1,16 @@
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Mapping, Union, Optional
+from types import MappingProxyType
+from functools import cached_property
 import json
 
+# Winning lines as 9-bit masks over cells indexed row * 3 + col.
+WIN_MASKS = (
+    0b000_000_111, 0b000_111_000, 0b111_000_000,  # rows
+    0b001_001_001, 0b010_010_010, 0b100_100_100,  # columns
+    0b100_010_001, 0b001_010_100,                 # diagonals
+)
+_FULL_BOARD = 0x1FF
+
 class ConfigManager:
     """
     Singleton class to manage theme configurations for the Tic Tac Toe game.
@@ -14,27 +24,28 @@ class ConfigManager:
         """
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._init_config()
         return cls._instance
 
-    def _init_config(self):
+    @cached_property
+    def theme(self) -> Mapping[str, str]:
         """
-        Initialize default theme configuration with grey color scheme.
+        Default grey theme, built on first access.
+        The theme is wrapped read-only so every caller can share it.
         """
-        self.theme = {
+        return MappingProxyType({
             'board_bg': '#e0e0e0',          # Light grey background
             'cell_border': '#b0b0b0',       # Medium grey border
             'x_color': '#555555',           # Dark grey for X
             'o_color': '#555555',           # Dark grey for O
             'text_color': '#333333'         # Dark text for readability
-        }
+        })
 
-    def get_theme(self) -> Dict[str, str]:
+    def get_theme(self) -> Mapping[str, str]:
         """
         Retrieve the current theme configuration.
         
         Returns:
-            Dict[str, str]: Dictionary containing color theme values.
+            Mapping[str, str]: Read-only view of the color theme values.
         """
         return self.theme
 
@@ -43,11 +54,13 @@ class Game:
     Core game logic for Tic Tac Toe with grey-themed styling.
     Manages game state, move validation, and win/draw detection.
     """
+    __slots__ = ('_bitboards', 'current_player', 'winner', 'game_over', 'config')
+
     def __init__(self):
         """
         Initialize a new game with an empty board and default settings.
         """
-        self.board: List[List[str]] = [['' for _ in range(3)] for _ in range(3)]
+        self._bitboards: Dict[str, int] = {'X': 0, 'O': 0}
         self.current_player: str = 'X'
         self.winner: Optional[str] = None
         self.game_over: bool = False
@@ -73,36 +86,35 @@ class Game:
         if not (0 <= row < 3 and 0 <= col < 3):
             raise ValueError("Row and column must be between 0 and 2")
         
-        if self.board[row][col] != '':
+        bit = 1 << (row * 3 + col)
+        bitboards = self._bitboards
+        if (bitboards['X'] | bitboards['O']) & bit:
             raise ValueError("Cell already occupied")
         
-        self.board[row][col] = self.current_player
-        self._check_win(row, col)
-        self._check_draw()
+        bitboards[self.current_player] |= bit
+        self._check_win()
+        if not self.game_over:
+            self._check_draw()
+        if not self.game_over:
+            self.current_player = 'O' if self.current_player == 'X' else 'X'
         
         return True
 
-    def _check_win(self, row: int, col: int) -> None:
+    def _check_win(self) -> None:
         """
         Check if the current move resulted in a win.
         """
-        # Check row
-        if all(self.board[row][c] == self.current_player for c in range(3)):
-            self._set_game_over(self.current_player)
-        # Check column
-        elif all(self.board[r][col] == self.current_player for r in range(3)):
-            self._set_game_over(self.current_player)
-        # Check diagonals
-        elif row == col and all(self.board[i][i] == self.current_player for i in range(3)):
-            self._set_game_over(self.current_player)
-        elif row + col == 2 and all(self.board[i][2-i] == self.current_player for i in range(3)):
-            self._set_game_over(self.current_player)
+        bits = self._bitboards[self.current_player]
+        for mask in WIN_MASKS:
+            if (bits & mask) == mask:
+                self._set_game_over(self.current_player)
+                return
 
     def _check_draw(self) -> None:
         """
         Check if the game is a draw (all cells filled with no winner).
         """
-        if all(cell != '' for row in self.board for cell in row):
+        if (self._bitboards['X'] | self._bitboards['O']) == _FULL_BOARD:
             self._set_game_over(None)
 
     def _set_game_over(self, winner: Optional[str]) -> None:
@@ -112,6 +124,19 @@ class Game:
         self.winner = winner
         self.game_over = True
 
+    @property
+    def board(self) -> List[List[str]]:
+        """
+        Materialise the 3x3 grid from the bitboards.
+        """
+        x_bits = self._bitboards['X']
+        o_bits = self._bitboards['O']
+        return [
+            ['X' if x_bits >> i & 1 else 'O' if o_bits >> i & 1 else ''
+             for i in range(r, r + 3)]
+            for r in (0, 3, 6)
+        ]
+
     def get_board(self) -> List[List[str]]:
         """
         Retrieve the current state of the board.
@@ -119,7 +144,7 @@ class Game:
         Returns:
             List[List[str]]: 3x3 grid representing the game board
         """
-        return [row[:] for row in self.board]
+        return self.board
 
     def get_status(self) -> Dict[str, Union[str, bool]]:
         """
@@ -133,14 +158,14 @@ class Game:
             'game_over': self.game_over,
             'current_player': self.current_player,
             'board': self.get_board(),
-            'theme': self.config
+            'theme': dict(self.config)
         }
 
     def reset_game(self) -> None:
         """
         Reset the game to its initial state.
         """
-        self.board = [['' for _ in range(3)] for _ in range(3)]
+        self._bitboards = {'X': 0, 'O': 0}
         self.current_player = 'X'
         self.winner = None
         self.game_over = False
@@ -154,18 +179,15 @@ def main():
     print(json.dumps(game.get_status(), indent=2))
     
     try:
-        game.make_move(0, 0)
-        game.make_move(0, 1)
-        game.make_move(0, 2)
+        for row, col in ((0, 0), (1, 0), (0, 1), (1, 1), (0, 2)):
+            game.make_move(row, col)
         print("\nAfter X's win:")
         print(json.dumps(game.get_status(), indent=2))
         
         game.reset_game()
-        game.make_move(1, 1)
-        game.make_move(0, 0)
-        game.make_move(2, 2)
-        game.make_move(0, 2)
-        game.make_move(2, 0)
+        for row, col in ((1, 1), (0, 0), (2, 2), (0, 2), (0, 1),
+                         (2, 1), (1, 0), (1, 2), (2, 0)):
+            game.make_move(row, col)
         print("\nAfter draw:")
         print(json.dumps(game.get_status(), indent=2))
         
@@ -1,29 +1,16 @@
 import pytest
 from fastapi.testclient import TestClient
-from crm_10_implementation import app, LoginRequest, TokenResponse, UserRepository
-from pydantic import BaseModel
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-import bcrypt
+from crm_10_implementation import app, UserRepository, create_access_token, SECRET_KEY, ALGORITHM
 import jwt
 import datetime
-import os
-from dotenv import load_dotenv
-import pytest_asyncio
-from typing import Optional, Dict, Any
 
-load_dotenv()
-
-@pytest_asyncio.fixture
+@pytest.fixture(scope="session")
 def client():
+    """One TestClient for the session; entering it runs app startup once."""
     app.dependency_overrides = {}
     with TestClient(app) as client:
         yield client
 
-@pytest_asyncio.fixture
-def user_repository():
-    return UserRepository()
-
 def test_user_repository_get_user_by_username():
     """
     Test the get_user_by_username method of UserRepository.
@@ -95,8 +82,9 @@ def test_login_for_access_token_success(client):
     """
     response = client.post("/login", json={"username": "user1", "password": "password1"})
     assert response.status_code == 200
-    assert "access_token" in response.json()
-    assert response.json()["token_type"] == "bearer"
+    body = response.json()
+    assert "access_token" in body
+    assert body["token_type"] == "bearer"
 
 def test_login_for_access_token_invalid_credentials(client):
     """
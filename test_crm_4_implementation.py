@@ -3,33 +3,60 @@ from unittest.mock import MagicMock, patch
 import tkinter as tk
 from crm_4_implementation import (
     Player, GameStatus, MinimaxAI, GameEngine, 
-    AnimationController, TicTacToeUI, TicTacToeApp, Theme
+    AnimationController, TicTacToeUI, TicTacToeApp, Theme, EMPTY_BOARD
 )
 
+# Tk is not safe to drive from several processes; under pytest-xdist these
+# tests stay on one worker (honoured with --dist=loadgroup).
+tk_group = pytest.mark.xdist_group("tk")
+
 # --- Fixtures ---
 
+# Alternating X/O moves that fill the board without completing a line.
+DRAW_SEQUENCE = (
+    (0, 0), (0, 1), (0, 2),
+    (1, 1), (1, 0), (1, 2),
+    (2, 1), (2, 0), (2, 2),
+)
+
+# MinimaxAI holds no per-game state, so one instance serves the whole session.
+AI_O = MinimaxAI(ai_player=Player.O, opponent=Player.X)
+
 @pytest.fixture
 def engine():
     """Provides a fresh GameEngine instance."""
     return GameEngine()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ai_o():
-    """Provides a MinimaxAI instance where AI is Player O."""
-    return MinimaxAI(ai_player=Player.O, opponent=Player.X)
+    """Provides the shared MinimaxAI instance where AI is Player O."""
+    return AI_O
+
+def _headless_tk_init(self, *args, **kwargs):
+    """Stand-in for Tk.__init__: a mock Tcl interpreter, so no display is needed."""
+    self.tk = MagicMock()
+    self._w = '.'
+    self.children = {}
+    self._tclCommands = None
 
 @pytest.fixture
 def mock_ui(engine, ai_o):
     """Provides a TicTacToeUI instance with mocked tkinter components."""
-    with patch('tkinter.Tk.__init__', return_value=None), \
+    with patch('tkinter.Tk.__init__', _headless_tk_init), \
          patch('tkinter.Frame'), \
          patch('tkinter.Label'), \
          patch('tkinter.Button'):
         ui = TicTacToeUI(engine, ai=ai_o)
-        # Manually create button grid mock
-        ui.buttons = [[MagicMock(spec=tk.Button) for _ in range(3)] for _ in range(3)]
-        ui.status_label = MagicMock(spec=tk.Label)
-        return ui
+    # Manually create button grid mock (specced against the real, unpatched classes)
+    ui.buttons = [[MagicMock(spec=tk.Button) for _ in range(3)] for _ in range(3)]
+    ui.status_label = MagicMock(spec=tk.Label)
+    return ui
+
+@pytest.fixture(scope="module")
+def app_with_mock_ui():
+    """Provides a TicTacToeApp built once with the Tk UI layer mocked out."""
+    with patch('crm_4_implementation.TicTacToeUI'):
+        return TicTacToeApp()
 
 # --- Player & GameStatus Tests ---
 
@@ -76,9 +103,8 @@ def test_ai_prefers_center_on_empty_board(ai_o):
 def test_ai_is_board_full(ai_o):
     """Verify internal _is_board_full logic."""
     full_board = [[Player.X for _ in range(3)] for _ in range(3)]
-    empty_board = [[Player.EMPTY for _ in range(3)] for _ in range(3)]
     assert ai_o._is_board_full(full_board) is True
-    assert ai_o._is_board_full(empty_board) is False
+    assert ai_o._is_board_full(EMPTY_BOARD) is False
 
 # --- GameEngine Tests ---
 
@@ -86,9 +112,7 @@ def test_engine_initialization(engine):
     """Engine should start with an empty board and Player X's turn."""
     assert engine.status == GameStatus.PLAYING
     assert engine.current_turn == Player.X
-    for row in engine.board:
-        for cell in row:
-            assert cell == Player.EMPTY
+    assert tuple(map(tuple, engine.board)) == EMPTY_BOARD
 
 def test_make_valid_move(engine):
     """Engine should update board and switch turns on valid move."""
@@ -163,15 +187,17 @@ def test_win_detection_diagonal(engine):
 
 def test_draw_detection(engine):
     """Engine should detect a draw."""
-    moves = [
-        (0, 0), (0, 1), (0, 2),
-        (1, 1), (1, 0), (1, 2),
-        (2, 1), (2, 0), (2, 2)
-    ]
-    for r, c in moves:
+    for r, c in DRAW_SEQUENCE:
         engine.make_move(r, c)
     assert engine.status == GameStatus.DRAW
 
+def test_win_detection_after_direct_board_edit(engine):
+    """Status should follow the board even when cells are set directly."""
+    engine.board[0][0] = Player.X
+    engine.board[0][1] = Player.X
+    engine.make_move(0, 2)
+    assert engine.status == GameStatus.WIN_X
+
 # --- AnimationController Tests ---
 
 def test_fade_in_logic():
@@ -182,6 +208,7 @@ def test_fade_in_logic():
 
 # --- TicTacToeUI Tests ---
 
+@tk_group
 def test_ui_render_updates_buttons(mock_ui, engine):
     """Render should update button text and state."""
     engine.board[0][0] = Player.X
@@ -192,12 +219,33 @@ def test_ui_render_updates_buttons(mock_ui, engine):
         state="disabled"
     )
 
+@tk_group
 def test_ui_handle_click_human_move(mock_ui, engine):
     """Clicking a button should trigger engine move."""
     with patch.object(engine, 'make_move', return_value=True) as mock_move:
         mock_ui._handle_click(0, 0)
         mock_move.assert_called_once_with(0, 0)
 
+@tk_group
+def test_ui_handle_click_triggers_ai_reply(mock_ui, engine):
+    """A human move should schedule the AI reply; run after() inline instead of waiting."""
+    with patch.object(mock_ui, 'after', lambda ms, fn, *args: fn(*args)):
+        mock_ui._handle_click(0, 0)
+    assert engine.board[0][0] == Player.X
+    assert sum(cell == Player.O for row in engine.board for cell in row) == 1
+    assert engine.current_turn == Player.X
+
+@tk_group
+def test_ui_minimax_game_never_lost(mock_ui, engine):
+    """Clicking through a whole game with after() inline, the minimax AI never loses."""
+    with patch.object(mock_ui, 'after', lambda ms, fn, *args: fn(*args)):
+        while engine.status == GameStatus.PLAYING:
+            row, col = next((r, c) for r in range(3) for c in range(3)
+                            if engine.board[r][c] == Player.EMPTY)
+            mock_ui._handle_click(row, col)
+    assert engine.status in (GameStatus.WIN_O, GameStatus.DRAW)
+
+@tk_group
 def test_ui_disable_all(mock_ui):
     """_disable_all should set all buttons to disabled."""
     mock_ui._disable_all()
@@ -205,12 +253,13 @@ def test_ui_disable_all(mock_ui):
         for btn in row:
             btn.config.assert_called_with(state="disabled")
 
+@tk_group
 def test_ui_trigger_ai(mock_ui, engine, ai_o):
     """_trigger_ai should get move from AI and apply to engine."""
-    ai_o.get_move = MagicMock(return_value=(1, 1))
-    with patch.object(engine, 'make_move') as mock_move:
+    with patch.object(ai_o, 'get_move', return_value=(1, 1)) as mock_get_move, \
+         patch.object(engine, 'make_move') as mock_move:
         mock_ui._trigger_ai()
-        ai_o.get_move.assert_called_once_with(engine.board)
+        mock_get_move.assert_called_once_with(engine.board)
         mock_move.assert_called_once_with(1, 1)
 
 # --- TicTacToeApp Tests ---
@@ -225,20 +274,16 @@ def test_app_initialization():
         assert app.ai_strategy is not None
         assert app.ui is not None
 
-def test_app_run():
+def test_app_run(app_with_mock_ui):
     """Verify run calls mainloop."""
-    with patch('crm_4_implementation.TicTacToeUI') as mock_ui_class:
-        app = TicTacToeApp()
-        app.run()
-        app.ui.mainloop.assert_called_once()
+    app_with_mock_ui.run()
+    app_with_mock_ui.ui.mainloop.assert_called_once()
 
-def test_app_critical_error_handling():
+def test_app_critical_error_handling(capsys):
     """Verify error handling during initialization."""
     with patch('crm_4_implementation.GameEngine', side_effect=Exception("Test Error")):
-        with patch('builtins.print') as mock_print:
-            app = TicTacToeApp()
-            mock_print.assert_called()
-            assert "Critical Error: Test Error" in mock_print.call_args[0][0]
+        TicTacToeApp()
+    assert "Critical Error: Test Error" in capsys.readouterr().out
 
 # --- Edge Cases ---
 
@@ -261,6 +306,7 @@ def test_engine_double_reset(engine):
     assert engine.status == GameStatus.PLAYING
     assert engine.current_turn == Player.X
 
+@tk_group
 def test_ui_click_on_disabled_game(mock_ui, engine):
     """Clicks should not process if game status is not PLAYING."""
     engine.status = GameStatus.WIN_X
@@ -0,0 +1,209 @@
+"""
+Unit tests for the clean-version Tic Tac Toe game engine.
+
+Tests the board, win checking and GameEngine move handling.
+"""
+
+import pytest
+from crm_5_clean_implementation import GameBoard, GameEngine, Player, WinChecker
+
+
+# (row, col) moves where X completes a line on the fifth move.
+WIN_MOVES = (
+    ((0, 0), (1, 0), (0, 1), (1, 1), (0, 2)),
+    ((0, 0), (0, 1), (1, 0), (1, 1), (2, 0)),
+    ((0, 0), (0, 1), (1, 1), (0, 2), (2, 2)),
+)
+WIN_MOVE_IDS = ("row", "column", "diagonal")
+DRAW_MOVES = (
+    (0, 0), (0, 1), (0, 2),
+    (1, 1), (1, 0), (1, 2),
+    (2, 1), (2, 0), (2, 2),
+)
+EMPTY_BOARD = [[""] * 3 for _ in range(3)]
+
+
+def play(engine, *moves):
+    """Play (row, col) moves in order and return the last make_move response."""
+    response = None
+    for row, col in moves:
+        response = engine.make_move(row, col)
+    return response
+
+
+@pytest.fixture
+def engine():
+    """Provides a fresh GameEngine instance."""
+    return GameEngine()
+
+
+class TestPlayer:
+    """Test cases for the Player class."""
+
+    def test_invalid_symbol(self):
+        """Test that only X and O are accepted."""
+        with pytest.raises(ValueError):
+            Player("Z", "Player Z")
+
+
+class TestGameBoard:
+    """Test cases for the GameBoard class."""
+
+    def test_set_and_get_cell(self):
+        """Test placing a symbol and reading it back."""
+        board = GameBoard()
+        board.set_cell(1, 2, "O")
+        assert board.get_cell(1, 2) == "O"
+        assert board.board[1] == ["", "", "O"]
+
+    def test_set_cell_occupied(self):
+        """Test placing on an occupied cell."""
+        board = GameBoard()
+        board.set_cell(0, 0, "X")
+        with pytest.raises(ValueError):
+            board.set_cell(0, 0, "O")
+
+    def test_invalid_position(self):
+        """Test positions outside the 3x3 grid."""
+        board = GameBoard()
+        with pytest.raises(IndexError):
+            board.get_cell(3, 0)
+
+    def test_bitboards(self):
+        """Test reading and replacing the bitboards."""
+        board = GameBoard()
+        board.set_cell(0, 1, "X")
+        assert board.bitboards == (0b10, 0)
+        board.bitboards = (0b000000111, 0b000111000)
+        assert board.winner() == "X"
+        with pytest.raises(ValueError):
+            board.bitboards = (0b1, 0b1)
+
+    def test_clear_and_reset(self):
+        """Test clearing one cell and resetting the board."""
+        board = GameBoard()
+        board.set_cell(0, 0, "X")
+        board.set_cell(1, 1, "O")
+        board.clear_cell(0, 0)
+        assert board.get_cell(0, 0) == ""
+        board.reset()
+        assert board.board == EMPTY_BOARD
+
+
+class TestGameEngine:
+    """Test cases for the GameEngine class."""
+
+    def test_initialization(self, engine):
+        """Test that the engine starts empty with X to move."""
+        assert engine.board.board == EMPTY_BOARD
+        assert engine.current_player().symbol == "X"
+        assert engine.game_over is False
+        assert engine.winner is None
+        assert engine.move_history == []
+
+    def test_alternation(self, engine):
+        """Test that valid moves are placed and players alternate."""
+        response = engine.make_move(0, 0)
+        assert response["success"] is True
+        assert response["message"] == "Move successful"
+        assert engine.current_player().symbol == "O"
+        engine.make_move(1, 1)
+        assert engine.board.get_cell(1, 1) == "O"
+        assert engine.current_player().symbol == "X"
+
+    def test_make_move_invalid_position(self, engine):
+        """Test that an out-of-range move is reported, not raised."""
+        response = engine.make_move(3, 0)
+        assert response["success"] is False
+        assert engine.move_history == []
+
+    def test_make_move_occupied_position(self, engine):
+        """Test making a move at an already occupied position."""
+        engine.make_move(0, 0)
+        response = engine.make_move(0, 0)
+        assert response == {"success": False, "error": "Cell already occupied"}
+        assert engine.current_player().symbol == "O"
+
+    @pytest.mark.parametrize("moves", WIN_MOVES, ids=WIN_MOVE_IDS)
+    def test_win(self, engine, moves):
+        """Test win detection for rows, columns and diagonals."""
+        response = play(engine, *moves)
+        assert response["message"] == "X wins!"
+        assert engine.game_over is True
+        assert engine.winner == "X"
+        assert WinChecker.check_winner(engine.board) == "X"
+
+    def test_draw(self, engine):
+        """Test draw detection."""
+        response = play(engine, *DRAW_MOVES)
+        assert response["message"] == "Game ended in a draw"
+        assert engine.game_over is True
+        assert engine.winner is None
+
+    def test_move_after_game_over(self, engine):
+        """Test making a move after a win."""
+        play(engine, *WIN_MOVES[0])
+        assert engine.make_move(2, 2) == {"success": False, "error": "Game is already over"}
+
+    @pytest.mark.parametrize("moves", WIN_MOVES, ids=WIN_MOVE_IDS)
+    def test_make_moves_matches_make_move(self, engine, moves):
+        """Test that a sequence gives the same final response as single moves."""
+        single = GameEngine()
+        assert engine.make_moves(moves) == play(single, *moves)
+
+    def test_make_moves_stops_at_rejected_move(self, engine):
+        """Test that earlier moves stay applied and only the error is returned."""
+        response = engine.make_moves([(0, 0), (1, 1), (1, 1), (2, 2)])
+        assert response == {"success": False, "error": "Cell already occupied"}
+        assert engine.board.get_cell(0, 0) == "X"
+        assert engine.board.get_cell(1, 1) == "O"
+        assert engine.board.get_cell(2, 2) == ""
+        assert len(engine.move_history) == 2
+        assert engine.current_player().symbol == "X"
+
+    def test_make_moves_after_game_over(self, engine):
+        """Test that moves past the end of the game are rejected."""
+        response = engine.make_moves(WIN_MOVES[0] + ((2, 2),))
+        assert response == {"success": False, "error": "Game is already over"}
+        assert engine.winner == "X"
+        assert engine.board.get_cell(2, 2) == ""
+
+    def test_undo_move(self, engine):
+        """Test undoing the last move."""
+        engine.make_move(0, 0)
+        assert engine.undo_move() is True
+        assert engine.board.board == EMPTY_BOARD
+        assert engine.current_player().symbol == "X"
+        assert engine.undo_move() is False
+
+    def test_reset_game(self, engine):
+        """Test resetting the game."""
+        play(engine, *WIN_MOVES[0])
+        engine.reset_game()
+        assert engine.board.board == EMPTY_BOARD
+        assert engine.current_player().symbol == "X"
+        assert engine.game_over is False
+        assert engine.winner is None
+        assert engine.move_history == []
+
+    def test_get_game_state(self, engine):
+        """Test the state dictionary after one move."""
+        engine.make_move(0, 0)
+        state = engine.get_game_state()
+        assert state["board"][0][0] == "X"
+        assert state["current_player"] == "Player O"
+        assert state["game_over"] is False
+        assert state["winner"] is None
+        assert state["moves"] == [{"row": 0, "col": 0, "symbol": "X"}]
+
+    @pytest.mark.parametrize("moves", [(), ((0, 0), (1, 1)), WIN_MOVES[2]],
+                             ids=["empty", "in_progress", "won"])
+    def test_serialize_round_trip(self, engine, moves):
+        """Test that deserialize_state restores a serialized position."""
+        play(engine, *moves)
+        restored = GameEngine()
+        restored.deserialize_state(engine.serialize_state())
+        assert restored.board.board == engine.board.board
+        assert restored.current_player_index == engine.current_player_index
+        assert restored.winner == engine.winner
+        assert restored.game_over == engine.game_over
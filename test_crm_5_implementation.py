@@ -1,7 +1,6 @@
 import pytest
-from unittest.mock import patch, MagicMock
-import os
 import json
+import re
 
 from crm_5_implementation import (
     PlayerSymbol,
@@ -11,10 +10,84 @@ from crm_5_implementation import (
     TicTacToe,
     create_html_template,
     save_game_state,
-    load_game_state
+    load_game_state,
+    main
 )
 
 
+@pytest.fixture(scope="session")
+def player_x():
+    """Player X, shared across the session since tests never mutate it."""
+    return Player(PlayerSymbol.X, "Player X")
+
+
+@pytest.fixture(scope="session")
+def player_o():
+    """Player O, shared across the session since tests never mutate it."""
+    return Player(PlayerSymbol.O, "Player O")
+
+
+@pytest.fixture
+def new_game(player_x, player_o):
+    """Factory for fresh TicTacToe games between the shared players."""
+    def factory(board_size: int = 3) -> TicTacToe:
+        return TicTacToe(player_x, player_o, board_size)
+    return factory
+
+
+@pytest.fixture(scope="session")
+def shared_game(player_x, player_o):
+    """One standard TicTacToe for the session; use it through the game fixture."""
+    return TicTacToe(player_x, player_o)
+
+
+@pytest.fixture
+def game(shared_game):
+    """The session's standard game, reset in place before each test."""
+    shared_game.reset()
+    return shared_game
+
+
+# Move sequences where X completes a line on the fifth move.
+ROW_WIN_MOVES = ((0, 0), (1, 1), (0, 1), (1, 0), (0, 2))
+COLUMN_WIN_MOVES = ((0, 0), (1, 1), (1, 0), (2, 1), (2, 0))
+DIAGONAL_WIN_MOVES = ((0, 0), (0, 1), (1, 1), (0, 2), (2, 2))
+# Move sequence that fills the board without either player completing a line.
+DRAW_MOVES = ((0, 0), (0, 1), (0, 2), (1, 1), (1, 0), (1, 2), (2, 1), (2, 0), (2, 2))
+
+
+def _played_game(player_x, player_o, moves):
+    """Play a move sequence on a fresh game and return it."""
+    game = TicTacToe(player_x, player_o)
+    game.apply_moves(moves)
+    return game
+
+
+# Terminal games are played once per module; tests must not mutate them.
+@pytest.fixture(scope="module")
+def row_win_game(player_x, player_o):
+    """Game won by X across the top row."""
+    return _played_game(player_x, player_o, ROW_WIN_MOVES)
+
+
+@pytest.fixture(scope="module")
+def column_win_game(player_x, player_o):
+    """Game won by X down the first column."""
+    return _played_game(player_x, player_o, COLUMN_WIN_MOVES)
+
+
+@pytest.fixture(scope="module")
+def diagonal_win_game(player_x, player_o):
+    """Game won by X along the main diagonal."""
+    return _played_game(player_x, player_o, DIAGONAL_WIN_MOVES)
+
+
+@pytest.fixture(scope="module")
+def drawn_game(player_x, player_o):
+    """Game that ends with a full board and no winner."""
+    return _played_game(player_x, player_o, DRAW_MOVES)
+
+
 class TestPlayerSymbol:
     """Test PlayerSymbol enumeration."""
     
@@ -52,7 +125,7 @@ class TestGameBoard:
         assert board.size == 3
         assert len(board.board) == 3
         assert all(len(row) == 3 for row in board.board)
-        assert all(cell is None for row in board.board for cell in row)
+        assert board._cells == bytes(board.size * board.size)
     
     def test_board_initialization_custom_size(self):
         """Test board initialization with custom size."""
@@ -101,9 +174,7 @@ class TestGameBoard:
     def test_is_full_full_board(self):
         """Test is_full on full board."""
         board = GameBoard()
-        for i in range(3):
-            for j in range(3):
-                board.make_move(i, j, PlayerSymbol.X)
+        board._cells[:] = b"\x01" * (board.size * board.size)  # X in every cell
         
         assert board.is_full() is True
     
@@ -116,6 +187,17 @@ class TestGameBoard:
         assert len(empty_cells) == 8
         assert (0, 0) not in empty_cells
     
+    def test_completes_line(self):
+        """Test line detection through a cell, including the anti-diagonal."""
+        board = GameBoard()
+        for row, col in ((0, 2), (1, 1), (2, 0)):
+            board.make_move(row, col, PlayerSymbol.O)
+        board.make_move(0, 0, PlayerSymbol.X)
+        
+        assert board.completes_line(2, 0) is True
+        assert board.completes_line(0, 0) is False
+        assert board.completes_line(2, 2) is False  # Empty cell
+    
     def test_reset_board(self):
         """Test resetting the board."""
         board = GameBoard()
@@ -123,121 +205,62 @@ class TestGameBoard:
         board.reset()
         
         assert board.is_full() is False
-        assert all(cell is None for row in board.board for cell in row)
+        assert board._cells == bytes(board.size * board.size)
 
 
 class TestTicTacToe:
     """Test TicTacToe class."""
     
-    def test_game_initialization(self):
+    def test_game_initialization(self, game, player_x, player_o):
         """Test game initialization."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2)
-        
-        assert game.player1 == player1
-        assert game.player2 == player2
-        assert game.current_player == player1
+        assert game.player1 == player_x
+        assert game.player2 == player_o
+        assert game.current_player == player_x
         assert game.status == GameStatus.PLAYING
         assert game.winner is None
         assert len(game.move_history) == 0
     
-    def test_game_initialization_custom_size(self):
+    def test_game_initialization_custom_size(self, new_game):
         """Test game initialization with custom board size."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2, 5)
+        game = new_game(5)
         
         assert game.board.size == 5
     
-    def test_make_move_valid(self):
+    def test_make_move_valid(self, game, player_o):
         """Test making a valid move."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2)
-        
         result = game.make_move(0, 0)
         
         assert result is True
-        assert game.current_player == player2
+        assert game.current_player == player_o
         assert len(game.move_history) == 1
         assert game.move_history[0] == (0, 0, PlayerSymbol.X)
     
-    def test_make_move_invalid_game_ended(self):
+    def test_make_move_invalid_game_ended(self, row_win_game):
         """Test making a move when game has ended."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2)
-        
-        # Make moves to end the game
-        game.make_move(0, 0)  # X plays at (0,0)
-        game.make_move(1, 1)  # O plays at (1,1)
-        game.make_move(0, 1)  # X plays at (0,1)
-        game.make_move(1, 0)  # O plays at (1,0)
-        game.make_move(0, 2)  # X plays at (0,2) - wins
-        
         with pytest.raises(Exception):  # Should raise an exception or handle properly
-            game.make_move(2, 2)
+            row_win_game.make_move(2, 2)
     
-    def test_check_win_row(self):
-        """Test win condition checking for row."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2)
+    @pytest.mark.parametrize(
+        "game_fixture",
+        ["row_win_game", "column_win_game", "diagonal_win_game"],
+        ids=["row", "column", "diagonal"],
+    )
+    def test_check_win(self, request, game_fixture, player_x):
+        """Test win condition checking for row, column and diagonal."""
+        game = request.getfixturevalue(game_fixture)
         
-        # Make moves to create a winning row
-        game.make_move(0, 0)  # X plays at (0,0)
-        game.make_move(1, 1)  # O plays at (1,1)
-        game.make_move(0, 1)  # X plays at (0,1)
-        game.make_move(1, 0)  # O plays at (1,0)
-        result = game.make_move(0, 2)  # X plays at (0,2) - wins
-        
-        assert result is True
-        assert game.status == GameStatus.PLAYING  # Should still be playing until next move
+        assert game.status == GameStatus.X_WINS
+        assert game.get_winner() == player_x
     
-    def test_check_win_column(self):
-        """Test win condition checking for column."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
+    def test_apply_moves_stops_at_rejected_move(self, game):
+        """Test that apply_moves plays in order and stops on an occupied cell."""
+        assert game.apply_moves([(0, 0), (1, 1)]) is True
+        assert game.apply_moves([(2, 2), (0, 0), (2, 0)]) is False
         
-        game = TicTacToe(player1, player2)
-        
-        # Make moves to create a winning column
-        game.make_move(0, 0)  # X plays at (0,0)
-        game.make_move(1, 1)  # O plays at (1,1)
-        game.make_move(1, 0)  # X plays at (1,0)
-        game.make_move(2, 1)  # O plays at (2,1)
-        result = game.make_move(2, 0)  # X plays at (2,0) - wins
-        
-        assert result is True
+        assert [move[:2] for move in game.move_history] == [(0, 0), (1, 1), (2, 2)]
     
-    def test_check_win_diagonal(self):
-        """Test win condition checking for diagonal."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2)
-        
-        # Make moves to create a winning diagonal
-        game.make_move(0, 0)  # X plays at (0,0)
-        game.make_move(1, 1)  # O plays at (1,1)
-        game.make_move(1, 0)  # X plays at (1,0)
-        game.make_move(2, 2)  # O plays at (2,2)
-        result = game.make_move(2, 0)  # X plays at (2,0) - wins
-        
-        assert result is True
-    
-    def test_get_game_state(self):
+    def test_get_game_state(self, game):
         """Test getting game state."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2)
         state = game.get_game_state()
         
         assert isinstance(state, dict)
@@ -246,118 +269,77 @@ class TestTicTacToe:
         assert "status" in state
         assert "winner" in state
     
-    def test_reset_game(self):
+    def test_reset_game(self, game, player_x):
         """Test resetting the game."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2)
         game.make_move(0, 0)  # X plays at (0,0)
+        game.reset()
         
-        # Reset the game
-        # Note: There's no explicit reset method in the original code,
-        # but we can simulate by creating a new game instance
-        
-        game2 = TicTacToe(player1, player2)
-        
-        assert game2.current_player == player1
-        assert game2.status == GameStatus.PLAYING
-        assert len(game2.move_history) == 0
+        assert game.current_player == player_x
+        assert game.status == GameStatus.PLAYING
+        assert len(game.move_history) == 0
+        assert game.board.get_cell(0, 0) is None
     
-    def test_draw_condition(self):
+    def test_draw_condition(self, drawn_game):
         """Test draw condition."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2)
-        
-        # Fill board with alternating moves to create a draw
-        game.make_move(0, 0)  # X plays at (0,0)
-        game.make_move(0, 1)  # O plays at (0,1)
-        game.make_move(0, 2)  # X plays at (0,2)
-        game.make_move(1, 0)  # O plays at (1,0)
-        game.make_move(1, 1)  # X plays at (1,1)
-        game.make_move(1, 2)  # O plays at (1,2)
-        game.make_move(2, 0)  # X plays at (2,0)
-        game.make_move(2, 1)  # O plays at (2,1)
-        game.make_move(2, 2)  # X plays at (2,2)
-        
-        # Check that game state is updated correctly
-        state = game.get_game_state()
-        assert state["status"] == "draw" or state["status"] == "o_wins" or state["status"] == "x_wins"
+        state = drawn_game.get_game_state()
+        assert state["status"] == "draw"
+
+
+# Page markers the template must contain, matched together in one scan.
+TEMPLATE_MARKERS = ("Tic Tac Toe", "Current Player:", "resetGame()", "saveGame()")
+TEMPLATE_MARKERS_RE = re.compile("|".join(map(re.escape, TEMPLATE_MARKERS)))
+
+
+@pytest.fixture(scope="module")
+def rendered_template(player_x, player_o):
+    """HTML for a fresh game, rendered once and shared by the module."""
+    game = TicTacToe(player_x, player_o)
+    return create_html_template(game.get_game_state(), "test_game")
 
 
 class TestCreateHtmlTemplate:
     """Test create_html_template function."""
     
-    def test_create_html_template(self):
+    def test_create_html_template(self, rendered_template):
         """Test creating HTML template with valid game state."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2)
-        state = game.get_game_state()
-        
-        html_content = create_html_template(state, "test_game")
+        html_content = rendered_template
         
         assert isinstance(html_content, str)
-        assert "Tic Tac Toe" in html_content
-        assert "Current Player:" in html_content
-        assert "resetGame()" in html_content
-        assert "saveGame()" in html_content
+        assert set(TEMPLATE_MARKERS_RE.findall(html_content)) == set(TEMPLATE_MARKERS)
+
+
+@pytest.fixture(scope="session")
+def saved_game_file(tmp_path_factory, player_x, player_o):
+    """Game saved after X's opening move, written once per session."""
+    game = TicTacToe(player_x, player_o)
+    game.make_move(0, 0)  # X plays at (0,0)
+    
+    file_path = tmp_path_factory.mktemp("games") / "test_game.json"
+    save_game_state(game, str(file_path))
+    return file_path
 
 
 class TestSaveLoadGameState:
     """Test save_game_state and load_game_state functions."""
     
-    def test_save_game_state(self, tmp_path):
+    def test_save_game_state(self, saved_game_file):
         """Test saving game state to file."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2)
-        game.make_move(0, 0)  # X plays at (0,0)
-        
-        file_path = tmp_path / "test_game.json"
-        save_game_state(game, str(file_path))
-        
-        assert file_path.exists()
-        
-        # Read and verify content
-        with open(file_path, 'r') as f:
-            saved_data = json.load(f)
-        
-        assert "current_player_symbol" in saved_data
-        assert "board" in saved_data
-        assert "status" in saved_data
+        state = json.loads(saved_game_file.read_text())
+        assert {"current_player_symbol", "board", "status"} <= state.keys()
+        assert state["board"][0][0] == "X"
     
-    def test_save_game_state_error(self, tmp_path):
+    def test_save_game_state_error(self, game):
         """Test saving game state with invalid path."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2)
-        
         # Try to save to a non-writable location
         with pytest.raises(IOError):
             save_game_state(game, "/nonexistent/directory/game.json")
     
-    def test_load_game_state(self, tmp_path):
+    def test_load_game_state(self, saved_game_file):
         """Test loading game state from file."""
-        player1 = Player(PlayerSymbol.X, "Player X")
-        player2 = Player(PlayerSymbol.O, "Player O")
-        
-        game = TicTacToe(player1, player2)
-        game.make_move(0, 0)  # X plays at (0,0)
-        
-        file_path = tmp_path / "test_game.json"
-        save_game_state(game, str(file_path))
-        
-        loaded_data = load_game_state(str(file_path))
+        loaded_data = load_game_state(str(saved_game_file))
         
         assert isinstance(loaded_data, dict)
-        assert "current_player_symbol" in loaded_data
-        assert "board" in loaded_data
+        assert {"current_player_symbol", "board", "status"} <= loaded_data.keys()
     
     def test_load_game_state_file_not_found(self):
         """Test loading game state from non-existent file."""
@@ -377,53 +359,38 @@ class TestSaveLoadGameState:
 class TestMainFunction:
     """Test main function."""
     
-    @patch('sys.stdout', new_callable=MagicMock)
-    def test_main_function(self, mock_stdout):
+    def test_main_function(self, capsys, tmp_path, monkeypatch):
         """Test main function execution."""
-        # This is a basic test - in real scenario, it would execute the full main function
-        # We're just ensuring it doesn't crash
+        # main() saves the demo game relative to the working directory,
+        # so run it from a temporary directory to keep the tree clean.
+        monkeypatch.chdir(tmp_path)
+        main()
         
-        try:
-            # Import here to avoid circular imports in test setup
-            from crm_5_implementation import main
-            
-            # We can't easily test the full main function without mocking more complex behavior
-            # But we can at least ensure it doesn't crash on basic execution
-            main()
-            
-            # If we get here without exception, the test passes
-            assert True
-            
-        except Exception as e:
-            # If there are exceptions, they should not be from basic functionality
-            # This is just a smoke test
-            assert "Error during game execution" not in str(e) or "main" in str(e)
-
-
-def test_edge_cases():
-    """Test edge cases for all classes and functions."""
-    
-    # Test invalid board size
-    with pytest.raises(Exception):
-        GameBoard(-1)  # This might raise an exception in real implementation
-    
-    # Test invalid player creation
-    with pytest.raises(Exception):
-        Player("invalid_symbol", "Player")  # This might raise an exception in real implementation
-    
-    # Test multiple wins condition (should be handled by game logic)
-    
-    # Test large board size
+        out = capsys.readouterr().out
+        assert "Error during game execution" not in out
+        assert "Game state saved successfully." in out
+        assert (tmp_path / "games" / "tic_tac_toe_game.json").exists()
+
+
+@pytest.mark.parametrize("size", [-1, 0, -5])
+def test_invalid_board_size(size):
+    """Test that non-positive board sizes are rejected."""
+    with pytest.raises(ValueError):
+        GameBoard(size)
+
+
+def test_invalid_player_symbol():
+    """Test that a player cannot be created with an unknown symbol."""
+    with pytest.raises(TypeError):
+        Player("invalid_symbol", "Player")
+
+
+@pytest.mark.slow
+def test_large_board_allocation():
+    """Test that a 100x100 board allocates one flat cell per square."""
     large_board = GameBoard(100)
     assert large_board.size == 100
-    
-    # Test negative board size
-    with pytest.raises(Exception):
-        GameBoard(-5)
-    
-    # Test zero board size
-    with pytest.raises(Exception):
-        GameBoard(0)
+    assert len(large_board._cells) == 10000
 
 
 def test_code_coverage():
@@ -439,14 +406,8 @@ def test_code_coverage():
     assert GameStatus.O_WINS.value == "o_wins"
     assert GameStatus.DRAW.value == "draw"
     
-    # Test that the main function can be called without error
-    try:
-        from crm_5_implementation import main
-        # We're not actually running main() here, just ensuring it exists
-        assert callable(main)
-    except Exception:
-        # If there are import errors, the test should fail gracefully
-        assert False
+    # Test that the main function exists (test_main_function runs it)
+    assert callable(main)
     
     # Test that all classes can be instantiated
     player1 = Player(PlayerSymbol.X, "Player X")
@@ -460,16 +421,11 @@ def test_code_coverage():
     assert isinstance(game, TicTacToe)
     
     # Test that all methods exist
-    assert hasattr(board, 'make_move')
-    assert hasattr(board, 'get_cell')
-    assert hasattr(board, 'is_full')
-    assert hasattr(board, 'get_empty_cells')
-    assert hasattr(board, 'reset')
+    required_board = {'make_move', 'get_cell', 'is_full', 'get_empty_cells', 'reset'}
+    assert required_board <= set(dir(board))
     
-    assert hasattr(game, 'make_move')
-    assert hasattr(game, 'get_game_state')
-    assert hasattr(game, 'current_player')
-    assert hasattr(game, 'status')
+    required_game = {'make_move', 'get_game_state', 'current_player', 'status'}
+    assert required_game <= set(dir(game))
     
     # Test that all constants are accessible
     assert PlayerSymbol.X is not None
@@ -478,292 +434,3 @@ def test_code_coverage():
     assert GameStatus.X_WINS is not None
     assert GameStatus.O_WINS is not None
     assert GameStatus.DRAW is not None
-"""
-Comprehensive unit tests for Tic Tac Toe game implementation.
-
-Tests all classes, methods, and edge cases for the Tic Tac Toe game.
-"""
-
-import pytest
-from crm_5_implementation import TicTacToeGame, TicTacToeUI, create_tic_tac_toe_game
-
-
-class TestTicTacToeGame:
-    """Test cases for the TicTacToeGame class."""
-
-    def test_initialization(self):
-        """Test that game initializes correctly."""
-        game = TicTacToeGame()
-        assert game.board == [''] * 9
-        assert game.current_player == 'X'
-        assert game.game_over is False
-        assert game.winner is None
-        assert game.move_count == 0
-
-    def test_make_move_valid_position(self):
-        """Test making a valid move at position 0."""
-        game = TicTacToeGame()
-        result = game.make_move(0)
-        assert result is True
-        assert game.board[0] == 'X'
-        assert game.current_player == 'O'
-        assert game.move_count == 1
-
-    def test_make_move_invalid_position_negative(self):
-        """Test making a move at negative position."""
-        game = TicTacToeGame()
-        with pytest.raises(ValueError):
-            game.make_move(-1)
-
-    def test_make_move_invalid_position_too_high(self):
-        """Test making a move at position 9."""
-        game = TicTacToeGame()
-        with pytest.raises(ValueError):
-            game.make_move(9)
-
-    def test_make_move_occupied_position(self):
-        """Test making a move at already occupied position."""
-        game = TicTacToeGame()
-        game.make_move(0)  # X at position 0
-        with pytest.raises(IndexError):
-            game.make_move(0)  # Try to place O at same position
-
-    def test_make_move_game_over(self):
-        """Test making a move after game is already over."""
-        game = TicTacToeGame()
-        # Fill the board to make it full
-        for i in range(9):
-            game.make_move(i)
-        # Try to make another move
-        result = game.make_move(8)
-        assert result is False
-
-    def test_check_win_rows(self):
-        """Test win detection for rows."""
-        game = TicTacToeGame()
-        # X wins with first row
-        game.make_move(0)
-        game.make_move(3)
-        game.make_move(1)
-        game.make_move(4)
-        result = game.make_move(2)
-        assert result is True
-        assert game.game_over is True
-        assert game.winner == 'X'
-
-    def test_check_win_columns(self):
-        """Test win detection for columns."""
-        game = TicTacToeGame()
-        # O wins with first column
-        game.make_move(0)
-        game.make_move(3)
-        game.make_move(1)
-        game.make_move(6)
-        result = game.make_move(2)
-        assert result is True
-        assert game.game_over is True
-        assert game.winner == 'X'
-
-    def test_check_win_diagonals(self):
-        """Test win detection for diagonals."""
-        game = TicTacToeGame()
-        # X wins with diagonal
-        game.make_move(0)
-        game.make_move(1)
-        game.make_move(4)
-        game.make_move(2)
-        result = game.make_move(8)
-        assert result is True
-        assert game.game_over is True
-        assert game.winner == 'X'
-
-    def test_check_win_draw(self):
-        """Test draw detection."""
-        game = TicTacToeGame()
-        # Fill board with alternating moves to create a draw
-        game.make_move(0)  # X
-        game.make_move(1)  # O
-        game.make_move(2)  # X
-        game.make_move(4)  # O
-        game.make_move(3)  # X
-        game.make_move(5)  # O
-        game.make_move(7)  # X
-        game.make_move(6)  # O
-        result = game.make_move(8)  # X - should end in draw
-        assert result is True
-        assert game.game_over is True
-        assert game.winner == 'Draw'
-
-    def test_reset_game(self):
-        """Test resetting the game."""
-        game = TicTacToeGame()
-        game.make_move(0)
-        game.make_move(1)
-        game.reset_game()
-        assert game.board == [''] * 9
-        assert game.current_player == 'X'
-        assert game.game_over is False
-        assert game.winner is None
-        assert game.move_count == 0
-
-    def test_get_board_state(self):
-        """Test getting board state."""
-        game = TicTacToeGame()
-        game.make_move(0)
-        board_state = game.get_board_state()
-        assert board_state[0] == 'X'
-        assert board_state[1] == ''
-        # Original board should be unchanged
-        assert game.board[0] == 'X'
-
-    def test_get_game_status(self):
-        """Test getting game status."""
-        game = TicTacToeGame()
-        game.make_move(0)
-        status = game.get_game_status()
-        assert status['board'][0] == 'X'
-        assert status['current_player'] == 'O'
-        assert status['game_over'] is False
-        assert status['winner'] is None
-        assert status['move_count'] == 1
-
-    def test_alternating_players(self):
-        """Test that players alternate correctly."""
-        game = TicTacToeGame()
-        game.make_move(0)
-        assert game.current_player == 'O'
-        game.make_move(1)
-        assert game.current_player == 'X'
-        game.make_move(2)
-        assert game.current_player == 'O'
-
-
-class TestTicTacToeUI:
-    """Test cases for the TicTacToeUI class."""
-
-    def test_ui_initialization(self):
-        """Test UI initialization."""
-        ui = TicTacToeUI()
-        assert isinstance(ui.game, TicTacToeGame)
-
-    def test_generate_html(self):
-        """Test HTML generation."""
-        ui = TicTacToeUI()
-        html_content = ui.generate_html()
-        assert '<!DOCTYPE html>' in html_content
-        assert 'Tic Tac Toe' in html_content
-        assert '<div class="cell" data-index="0"></div>' in html_content
-
-    def test_generate_css(self):
-        """Test CSS generation."""
-        ui = TicTacToeUI()
-        css_content = ui.generate_css()
-        assert 'body {' in css_content
-        assert '.cell {' in css_content
-        assert '@media' in css_content
-
-    def test_generate_javascript(self):
-        """Test JavaScript generation."""
-        ui = TicTacToeUI()
-        js_content = ui.generate_javascript()
-        assert 'class TicTacToeGame' in js_content
-        assert 'makeMove' in js_content
-        assert 'updateUI' in js_content
-
-
-def test_create_tic_tac_toe_game():
-    """Test creating complete game package."""
-    result = create_tic_tac_toe_game()
-    assert isinstance(result, dict)
-    assert 'html' in result
-    assert 'css' in result
-    assert 'js' in result
-    assert len(result['html']) > 0
-    assert len(result['css']) > 0
-    assert len(result['js']) > 0
-
-
-def test_main_function():
-    """Test main function runs without errors."""
-    # This is mainly for code coverage and to ensure the function can run
-    # The actual content is tested in other tests
-    pass
-
-
-class TestEdgeCases:
-    """Test edge cases for the game."""
-
-    def test_multiple_wins_same_row(self):
-        """Test that win is detected correctly even with multiple moves."""
-        game = TicTacToeGame()
-        # Create a winning condition
-        game.make_move(0)  # X
-        game.make_move(3)  # O
-        game.make_move(1)  # X
-        game.make_move(4)  # O
-        result = game.make_move(2)  # X - should win
-        assert result is True
-        assert game.game_over is True
-        assert game.winner == 'X'
-
-    def test_full_board_draw(self):
-        """Test draw with specific board arrangement."""
-        game = TicTacToeGame()
-        # Create a full board that should end in draw
-        moves = [0, 1, 2, 4, 3, 5, 7, 6, 8]  # X, O, X, O, X, O, X, O, X
-        for i, move in enumerate(moves):
-            game.make_move(move)
-        assert game.game_over is True
-        assert game.winner == 'Draw'
-
-    def test_empty_board(self):
-        """Test that initial board is empty."""
-        game = TicTacToeGame()
-        assert all(cell == '' for cell in game.board)
-
-    def test_invalid_move_after_win(self):
-        """Test making move after win."""
-        game = TicTacToeGame()
-        # Create a win condition
-        game.make_move(0)  # X
-        game.make_move(3)  # O
-        game.make_move(1)  # X
-        game.make_move(4)  # O
-        game.make_move(2)  # X - win
-        # Try to make another move after win
-        result = game.make_move(5)
-        assert result is False
-
-    def test_multiple_resets(self):
-        """Test resetting multiple times."""
-        game = TicTacToeGame()
-        game.make_move(0)
-        game.reset_game()
-        game.reset_game()  # Second reset
-        assert game.board == [''] * 9
-        assert game.current_player == 'X'
-
-    def test_win_with_different_patterns(self):
-        """Test win detection with different patterns."""
-        game = TicTacToeGame()
-        
-        # Test column win
-        game.make_move(0)  # X
-        game.make_move(1)  # O
-        game.make_move(3)  # X
-        game.make_move(4)  # O
-        result = game.make_move(6)  # X - win column 0
-        assert result is True
-        assert game.game_over is True
-        assert game.winner == 'X'
-        
-        # Reset and test diagonal win
-        game.reset_game()
-        game.make_move(0)  # X
-        game.make_move(1)  # O
-        game.make_move(4)  # X
-        game.make_move(2)  # O
-        result = game.make_move(8)  # X - win diagonal
-        assert result is True
-        assert game.game_over is True
-        assert game.winner == 'X'